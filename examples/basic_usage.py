@@ -2,13 +2,15 @@
 """Basic usage example for py-eacopy."""
 
 # Import built-in modules
+import importlib.util
 import os
 import sys
 import tempfile
 from pathlib import Path
 
-# Add the parent directory to sys.path to import the package
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add the parent directory to sys.path if the package is not installed
+if importlib.util.find_spec("eacopy") is None:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import the package
 import eacopy
@@ -26,15 +28,13 @@ def main():
 
         # Create a test file
         test_file = src_dir_path / "test.txt"
-        with open(test_file, "w") as f:
-            f.write("This is a test file for EACopy.")
+        test_file.write_bytes(b"This is a test file for EACopy.")
 
         # Create a subdirectory with files
         sub_dir = src_dir_path / "subdir"
         sub_dir.mkdir()
         for i in range(5):
-            with open(sub_dir / f"file{i}.txt", "w") as f:
-                f.write(f"This is file {i} in the subdirectory.")
+            (sub_dir / f"file{i}.txt").write_bytes(f"This is file {i} in the subdirectory.".encode())
 
         # Copy a single file
         print("\nCopying a single file...")
@@ -56,9 +56,9 @@ def main():
 
         # List the copied files
         print("\nFiles in destination directory:")
-        for path in dst_dir_path.glob("**/*"):
-            if path.is_file():
-                print(f"  {path.relative_to(dst_dir_path)}")
+        for root, _dirs, files in os.walk(dst_dir):
+            for name in files:
+                print(f"  {os.path.relpath(os.path.join(root, name), dst_dir)}")
 
     print("\nAll operations completed successfully!")
     return 0
@@ -2,13 +2,15 @@
 """Example of using EACopy with a server for accelerated file copying."""
 
 # Import built-in modules
+import importlib.util
 import os
 import sys
 import tempfile
 from pathlib import Path
 
-# Add the parent directory to sys.path to import the package
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add the parent directory to sys.path if the package is not installed
+if importlib.util.find_spec("eacopy") is None:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import the package
 import eacopy
@@ -35,34 +37,30 @@ def main():
         
         # Create a test file
         test_file = src_dir_path / "test.txt"
-        with open(test_file, "w") as f:
-            f.write("This is a test file for EACopy with server.")
+        test_file.write_bytes(b"This is a test file for EACopy with server.")
         
         # Create a subdirectory with files
         sub_dir = src_dir_path / "subdir"
         sub_dir.mkdir()
         for i in range(5):
-            with open(sub_dir / f"file{i}.txt", "w") as f:
-                f.write(f"This is file {i} in the subdirectory for server test.")
+            (sub_dir / f"file{i}.txt").write_bytes(f"This is file {i} in the subdirectory for server test.".encode())
         
         try:
-            # Copy a single file using the server
-            print("\nCopying a single file using EACopyService...")
+            # Copy a single file and a directory tree in one session, so the
+            # transfers overlap instead of running one after the other
+            print("\nCopying a file and a directory tree using EACopyService...")
             dst_file = dst_dir_path / "test_copy.txt"
-            eacopy.copy_with_server(str(test_file), str(dst_file), server_addr, server_port)
-            print(f"File copied to {dst_file}")
-            
-            # Copy a directory tree using the server
-            print("\nCopying a directory tree using EACopyService...")
             dst_subdir = dst_dir_path / "subdir_copy"
-            eacopy.copy_with_server(str(sub_dir), str(dst_subdir), server_addr, server_port)
+            with eacopy.Session(server_addr, server_port, streams=8) as session:
+                session.copy_many([(str(test_file), str(dst_file)), (str(sub_dir), str(dst_subdir))])
+            print(f"File copied to {dst_file}")
             print(f"Directory tree copied to {dst_subdir}")
             
             # List the copied files
             print("\nFiles in destination directory:")
-            for path in dst_dir_path.glob("**/*"):
-                if path.is_file():
-                    print(f"  {path.relative_to(dst_dir_path)}")
+            for root, _dirs, files in os.walk(dst_dir):
+                for name in files:
+                    print(f"  {os.path.relpath(os.path.join(root, name), dst_dir)}")
             
             print("\nAll operations completed successfully!")
             return 0
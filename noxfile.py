@@ -1,21 +1,142 @@
 # Import built-in modules
+import hashlib
 import os
 import platform
+import shutil
 import sys
 
 # Import third-party modules
 import nox
 
+THIS_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Spread tests over all CPUs, keeping each test module on one worker so
+# module level state is shared as before, and report the slowest tests
+PYTEST_ARGS = ["-n", "auto", "--dist=loadfile", "--durations=25", "--durations-min=0.1"]
+
+# Create session environments with uv when it is available; it resolves and
+# installs much faster than pip, and nox falls back to virtualenv without it
+nox.options.default_venv_backend = "uv|virtualenv"
+
+# Reuse session environments between runs instead of recreating them
+nox.options.reuse_venv = "yes"
+
+
+def _physical_cpu_count():
+    """Return the number of physical CPU cores, falling back to logical CPUs."""
+    try:
+        # Import third-party modules
+        import psutil
+    except ImportError:
+        return os.cpu_count() or 4
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 4
+
+
+# Compiling and linking on SMT siblings mostly competes for the same core, so
+# builds are parallelized over physical cores
+CPU_COUNT = _physical_cpu_count()
+
+
+def _compiler_cache_env():
+    """Return environment variables routing C/C++ compiles through a compiler cache.
+
+    sccache is preferred, then ccache. If neither is installed, no launcher is set.
+    """
+    if shutil.which("sccache"):
+        return {
+            "CMAKE_C_COMPILER_LAUNCHER": "sccache",
+            "CMAKE_CXX_COMPILER_LAUNCHER": "sccache",
+            "SCCACHE_DIR": os.environ.get("SCCACHE_DIR", os.path.expanduser("~/.cache/sccache")),
+        }
+    if shutil.which("ccache"):
+        return {
+            "CMAKE_C_COMPILER_LAUNCHER": "ccache",
+            "CMAKE_CXX_COMPILER_LAUNCHER": "ccache",
+            "CCACHE_DIR": os.environ.get("CCACHE_DIR", os.path.join(THIS_ROOT, ".ccache")),
+            # Hash paths relative to the checkout so the temporary build
+            # directories of isolated builds do not defeat the cache
+            "CCACHE_BASEDIR": THIS_ROOT,
+        }
+    return {}
+
+
+def _build_dir_env():
+    """Return environment variables placing the CMake build tree on tmpfs, if requested.
+
+    Opt in with PY_EACOPY_USE_TMPFS=1 on Linux. It trades disk I/O for RAM,
+    which can hurt on memory constrained machines, so it is off by default.
+    """
+    if os.environ.get("PY_EACOPY_USE_TMPFS") != "1" or not os.path.isdir("/dev/shm"):
+        return {}
+    build_dir = os.path.join("/dev/shm", f"py-eacopy-{os.getuid()}", "build", "{wheel_tag}")
+    return {"SKBUILD_BUILD_DIR": build_dir}
+
+
+def _build_env():
+    """Return a fresh environment for sessions that compile the extension."""
+    return {
+        "CMAKE_BUILD_PARALLEL_LEVEL": str(CPU_COUNT),
+        "CMAKE_GENERATOR": "Ninja",
+        # Also parallelize any sub-build that drives make directly
+        "MAKEFLAGS": f"-j{CPU_COUNT}",
+        **_compiler_cache_env(),
+        **_build_dir_env(),
+    }
+
+
+def _dev_build_env():
+    """Return the build environment for editable development installs.
+
+    These are rebuilt often and not shipped, so they are built as
+    RelWithDebInfo, which skips the link time optimization of Release builds.
+    Set PY_EACOPY_RELEASE=1 to build them as Release instead.
+    """
+    env = _build_env()
+    if os.environ.get("PY_EACOPY_RELEASE") != "1":
+        env["SKBUILD_CMAKE_BUILD_TYPE"] = "RelWithDebInfo"
+    return env
+
+
+def _list_wheels(directory="wheelhouse"):
+    """Return the names of the wheel files in a directory, sorted."""
+    with os.scandir(directory) as it:
+        return sorted(entry.name for entry in it if entry.name.endswith(".whl") and entry.is_file())
+
+
+# Files and directories under the source trees that are produced by builds,
+# imports or test runs rather than written by hand
+_GENERATED_DIRS = {".git", "__pycache__"}
+_GENERATED_SUFFIXES = (".pyc", ".pyo", ".so", ".pyd", ".dylib")
+
+
+def _source_hash():
+    """Return a hash of every input that affects the built extension."""
+    digest = hashlib.sha256()
+    paths = ["CMakeLists.txt", "pyproject.toml", ".cibuildwheel.toml"]
+    for top in ("src", os.path.join("extern", "EACopy")):
+        for root, dirs, files in os.walk(top):
+            dirs[:] = sorted(name for name in dirs if name not in _GENERATED_DIRS)
+            paths.extend(
+                os.path.join(root, name)
+                for name in sorted(files)
+                if name != ".git" and not name.endswith(_GENERATED_SUFFIXES)
+            )
+    for path in paths:
+        digest.update(path.encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
 
 @nox.session
 def lint(session):
     """Run linting checks."""
     session.install("ruff", "mypy", "isort")
-    session.run("mypy", "--install-types", "--non-interactive")
     session.run("ruff", "check", ".")
     session.run("ruff", "format", "--check", ".")
     session.run("isort", "--check-only", ".")
-    session.run("mypy", "src/eacopy", "--strict")
+    # A single run installs any missing stubs and type checks the package
+    session.run("mypy", "--install-types", "--non-interactive", "--strict", "src/eacopy")
 
 
 @nox.session
@@ -30,9 +151,22 @@ def lint_fix(session):
 @nox.session
 def pytest(session):
     """Run tests."""
-    session.install("pytest", "pytest-cov")
-    session.install("-e", ".")
-    session.run("pytest", "tests/", "--cov=eacopy", "--cov-report=xml:coverage.xml", "--cov-report=term-missing")
+    session.install("pytest", "pytest-cov", "pytest-xdist", "-e", ".", env=_dev_build_env())
+    session.run(
+        "pytest",
+        "tests/",
+        *PYTEST_ARGS,
+        "--cov=eacopy",
+        "--cov-report=xml:coverage.xml",
+        "--cov-report=term-missing",
+    )
+
+
+@nox.session
+def pytest_no_cov(session):
+    """Run tests without coverage, which is faster for local iteration."""
+    session.install("pytest", "pytest-xdist", "-e", ".", env=_dev_build_env())
+    session.run("pytest", "tests/", *PYTEST_ARGS)
 
 
 @nox.session
@@ -47,7 +181,6 @@ def docs(session):
 def docs_serve(session):
     """Build and serve documentation with live reloading."""
     session.install("-e", ".[docs]")
-    session.install("sphinx-autobuild")
     session.run("sphinx-autobuild", "docs", "docs/_build/html", "--open-browser")
 
 
@@ -58,10 +191,24 @@ def build_wheels(session):
     This session builds wheels for the current Python version and platform
     using cibuildwheel. Configuration is read from .cibuildwheel.toml.
     """
+    # Skip the build if the wheel for this Python was built from the same
+    # sources. Set PY_EACOPY_FORCE_BUILD=1 to rebuild anyway.
+    python_tag = f"cp{sys.version_info.major}{sys.version_info.minor}"
+    hash_file = os.path.join("wheelhouse", f".source-hash-{python_tag}")
+    source_hash = _source_hash()
+    if os.environ.get("PY_EACOPY_FORCE_BUILD") != "1" and os.path.exists(hash_file):
+        with open(hash_file) as f:
+            up_to_date = f.read().strip() == source_hash
+        if up_to_date and any(f"-{python_tag}-" in wheel for wheel in _list_wheels()):
+            session.log(f"Wheels for {python_tag} are up to date, skipping build.")
+            return
+
     # Install cibuildwheel and dependencies
     session.log("Installing cibuildwheel and dependencies...")
     session.install(
         "cibuildwheel",
+        # Needed by the pip wheel fallback; uv environments do not ship pip
+        "pip",
         "wheel",
         "setuptools>=42.0.0",
         "setuptools_scm>=8.0.0",
@@ -85,7 +232,21 @@ def build_wheels(session):
     # Set environment variables
     env = {
         "CIBW_BUILD_VERBOSITY": "3",
-        "CIBW_BUILD": f"cp{sys.version_info.major}{sys.version_info.minor}-*",
+        "CIBW_BUILD": f"{python_tag}-*",
+        **_build_env(),
+        # Release wheels are built from scratch, so batch translation units
+        # to parse shared headers once per batch. Kept out of the editable
+        # dev install, where it would make incremental rebuilds coarser.
+        "CMAKE_ARGS": " ".join(
+            filter(
+                None,
+                [
+                    os.environ.get("CMAKE_ARGS"),
+                    "-DCMAKE_UNITY_BUILD=ON",
+                    "-DCMAKE_UNITY_BUILD_BATCH_SIZE=16",
+                ],
+            )
+        ),
     }
 
     # Create output directory if it doesn't exist
@@ -119,6 +280,7 @@ def build_wheels(session):
                 "wheelhouse",
                 "--no-deps",
                 "-v",
+                env=env,
             )
     else:
         # On other platforms, use cibuildwheel
@@ -147,40 +309,67 @@ def build_wheels(session):
                 "wheelhouse",
                 "--no-deps",
                 "-v",
+                env=env,
             )
 
+    with open(hash_file, "w") as f:
+        f.write(source_hash)
+
     # List the built wheels
     session.log("Built wheels:")
-    for wheel in os.listdir("wheelhouse"):
-        if wheel.endswith(".whl"):
-            session.log(f"  - {wheel}")
+    for wheel in _list_wheels():
+        session.log(f"  - {wheel}")
 
 
 @nox.session
 def verify_wheels(session):
     """Verify the built wheels."""
-    session.install("wheel", "setuptools")
+    # Wheels are installed without resolving dependencies, so install the
+    # runtime requirements declared in pyproject.toml once up front
+    session.install(*nox.project.load_toml("pyproject.toml")["project"]["dependencies"])
 
     # Check if wheelhouse directory exists
     if not os.path.exists("wheelhouse"):
         session.error("No wheelhouse directory found. Run build_wheels first.")
 
     # List and verify wheels
-    wheels = [f for f in os.listdir("wheelhouse") if f.endswith(".whl")]
+    wheels = _list_wheels()
     if not wheels:
         session.error("No wheels found in wheelhouse directory.")
 
+    # The wheel installed in this (reused) environment is recorded by content
+    # hash, so an unchanged wheel is not reinstalled on every run. Installing
+    # a wheel replaces the previous one, so only the last install is recorded.
+    stamp_file = os.path.join(session.virtualenv.location, ".installed-wheel")
+    installed = None
+    if os.path.exists(stamp_file):
+        with open(stamp_file) as f:
+            installed = f.read().strip()
+
     session.log(f"Found {len(wheels)} wheels:")
     for wheel in wheels:
         session.log(f"  - {wheel}")
+        wheel_path = os.path.join("wheelhouse", wheel)
+        with open(wheel_path, "rb") as f:
+            wheel_hash = hashlib.sha256(f.read()).hexdigest()
+        if wheel_hash == installed:
+            session.log(f"Already installed {wheel}, skipping")
+            continue
+
+        # Forget the previous wheel first, since a failed install may leave
+        # the environment with neither of them
+        if os.path.exists(stamp_file):
+            os.remove(stamp_file)
 
         # Try to install the wheel
         try:
-            with session.chdir("wheelhouse"):
-                session.run("pip", "install", wheel, "--force-reinstall")
+            session.install(wheel_path, "--force-reinstall", "--no-deps", "--no-index")
             session.log(f"Successfully installed {wheel}")
         except Exception as e:
             session.error(f"Failed to install {wheel}: {e}")
+        installed = wheel_hash
+        with open(stamp_file, "w") as f:
+            f.write(wheel_hash)
 
     # Try to import the package
     session.run("python", "-c", "import eacopy; print(f'eacopy version: {eacopy.__version__}')")
@@ -1,6 +1,9 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/stl/filesystem.h>
+#include <algorithm>
 #include <string>
+#include <utility>
 #include <vector>
 #include <filesystem>
 #include <stdexcept>
@@ -10,25 +13,45 @@
 #include "EACopyClient.h"
 #include "EACopyServer.h"
 
+#include "native_copy.h"
+
 namespace py = pybind11;
 namespace fs = std::filesystem;
 
+// UTF-8 representation of a path, for error messages
+static std::string display_path(const fs::path& path) {
+    return path.u8string();
+}
+
+// Whether path is directory or lies below it, after resolving symlinks
+static bool is_same_or_inside(const fs::path& path, const fs::path& directory) {
+    const fs::path resolved = fs::weakly_canonical(path);
+    const fs::path resolved_dir = fs::weakly_canonical(directory);
+    auto mismatch = std::mismatch(resolved_dir.begin(), resolved_dir.end(), resolved.begin(), resolved.end());
+    return mismatch.first == resolved_dir.end();
+}
+
 // Wrapper class for EACopy functionality
 class EACopy {
 public:
-    EACopy() {}
+    explicit EACopy(size_t buffer_size = eacopy_native::kDefaultBufferSize)
+        : buffer_size_(buffer_size) {
+        if (buffer_size_ == 0) {
+            throw std::invalid_argument("buffer_size must be greater than zero");
+        }
+    }
 
     // Copy a file
-    void copyfile(const std::string& src, const std::string& dst) {
+    void copyfile(const fs::path& src, const fs::path& dst) {
         fs::path src_path(src);
         fs::path dst_path(dst);
 
         if (!fs::exists(src_path)) {
-            throw std::runtime_error("Source file does not exist: " + src);
+            throw std::runtime_error("Source file does not exist: " + display_path(src));
         }
 
         if (fs::is_directory(src_path)) {
-            throw std::runtime_error("Source is a directory, not a file: " + src);
+            throw std::runtime_error("Source is a directory, not a file: " + display_path(src));
         }
 
         // Create destination directory if it doesn't exist
@@ -37,28 +60,22 @@ public:
             fs::create_directories(dst_dir);
         }
 
-        // Use EACopy to copy the file
-        EACopyClient client;
-        client.SetSource(src_path.string().c_str());
-        client.SetDestination(dst_path.string().c_str());
-        client.SetCopyFlags(EACOPY_COPY_DATA);
-        
-        if (!client.DoCopy()) {
-            throw std::runtime_error("Failed to copy file: " + src + " to " + dst);
-        }
+        // Copy the file content
+        copy_single_file(src_path, dst_path, false,
+                         "Failed to copy file: " + display_path(src) + " to " + display_path(dst));
     }
 
     // Copy a file with metadata
-    void copy2(const std::string& src, const std::string& dst) {
+    void copy2(const fs::path& src, const fs::path& dst) {
         fs::path src_path(src);
         fs::path dst_path(dst);
 
         if (!fs::exists(src_path)) {
-            throw std::runtime_error("Source file does not exist: " + src);
+            throw std::runtime_error("Source file does not exist: " + display_path(src));
         }
 
         if (fs::is_directory(src_path)) {
-            throw std::runtime_error("Source is a directory, not a file: " + src);
+            throw std::runtime_error("Source is a directory, not a file: " + display_path(src));
         }
 
         // If dst is a directory, use the source filename
@@ -72,28 +89,22 @@ public:
             fs::create_directories(dst_dir);
         }
 
-        // Use EACopy to copy the file with metadata
-        EACopyClient client;
-        client.SetSource(src_path.string().c_str());
-        client.SetDestination(dst_path.string().c_str());
-        client.SetCopyFlags(EACOPY_COPY_DATA | EACOPY_COPY_ATTRIBUTES | EACOPY_COPY_TIMESTAMPS);
-        
-        if (!client.DoCopy()) {
-            throw std::runtime_error("Failed to copy file with metadata: " + src + " to " + dst);
-        }
+        // Copy the file content and metadata
+        copy_single_file(src_path, dst_path, true,
+                         "Failed to copy file with metadata: " + display_path(src) + " to " + display_path(dst));
     }
 
     // Copy a file without metadata
-    void copy(const std::string& src, const std::string& dst) {
+    void copy(const fs::path& src, const fs::path& dst) {
         fs::path src_path(src);
         fs::path dst_path(dst);
 
         if (!fs::exists(src_path)) {
-            throw std::runtime_error("Source file does not exist: " + src);
+            throw std::runtime_error("Source file does not exist: " + display_path(src));
         }
 
         if (fs::is_directory(src_path)) {
-            throw std::runtime_error("Source is a directory, not a file: " + src);
+            throw std::runtime_error("Source is a directory, not a file: " + display_path(src));
         }
 
         // If dst is a directory, use the source filename
@@ -107,19 +118,13 @@ public:
             fs::create_directories(dst_dir);
         }
 
-        // Use EACopy to copy the file
-        EACopyClient client;
-        client.SetSource(src_path.string().c_str());
-        client.SetDestination(dst_path.string().c_str());
-        client.SetCopyFlags(EACOPY_COPY_DATA);
-        
-        if (!client.DoCopy()) {
-            throw std::runtime_error("Failed to copy file: " + src + " to " + dst);
-        }
+        // Copy the file content
+        copy_single_file(src_path, dst_path, false,
+                         "Failed to copy file: " + display_path(src) + " to " + display_path(dst));
     }
 
     // Copy a directory tree
-    void copytree(const std::string& src, const std::string& dst, 
+    void copytree(const fs::path& src, const fs::path& dst, 
                   bool symlinks = false, 
                   bool ignore_dangling_symlinks = false,
                   bool dirs_exist_ok = false) {
@@ -127,21 +132,27 @@ public:
         fs::path dst_path(dst);
 
         if (!fs::exists(src_path)) {
-            throw std::runtime_error("Source directory does not exist: " + src);
+            throw std::runtime_error("Source directory does not exist: " + display_path(src));
         }
 
         if (!fs::is_directory(src_path)) {
-            throw std::runtime_error("Source is not a directory: " + src);
+            throw std::runtime_error("Source is not a directory: " + display_path(src));
         }
 
         // Check if destination exists and is not a directory
         if (fs::exists(dst_path) && !fs::is_directory(dst_path)) {
-            throw std::runtime_error("Destination exists and is not a directory: " + dst);
+            throw std::runtime_error("Destination exists and is not a directory: " + display_path(dst));
         }
 
         // Check if destination directory exists and dirs_exist_ok is false
         if (fs::exists(dst_path) && fs::is_directory(dst_path) && !dirs_exist_ok) {
-            throw std::runtime_error("Destination directory already exists: " + dst);
+            throw std::runtime_error("Destination directory already exists: " + display_path(dst));
+        }
+
+        // The copy would be walked into as it is being created
+        if (is_same_or_inside(dst_path, src_path)) {
+            throw std::runtime_error("Cannot copy a directory into itself: " + display_path(src) + " to " +
+                                     display_path(dst));
         }
 
         // Create destination directory if it doesn't exist
@@ -149,7 +160,14 @@ public:
             fs::create_directories(dst_path);
         }
 
+#if EACOPY_HAS_NATIVE_COPY
+        // Walk the tree and copy each file with the native copy primitive
+        copy_tree_native(src_path, dst_path, symlinks, ignore_dangling_symlinks);
+        eacopy_native::copy_directory_metadata(src_path, dst_path);
+#else
         // Use EACopy to copy the directory tree
+        (void)symlinks;
+        (void)ignore_dangling_symlinks;
         EACopyClient client;
         client.SetSource(src_path.string().c_str());
         client.SetDestination(dst_path.string().c_str());
@@ -157,12 +175,33 @@ public:
         client.SetRecursive(true);
         
         if (!client.DoCopy()) {
-            throw std::runtime_error("Failed to copy directory tree: " + src + " to " + dst);
+            throw std::runtime_error("Failed to copy directory tree: " + display_path(src) + " to " + display_path(dst));
         }
+#endif
+    }
+
+    // Copy many files with metadata. Paths are used as given: sources must be
+    // regular files and destination directories must already exist, so none
+    // of the per-file checks of copy2 are repeated. Returns the index and
+    // error message of each pair that failed.
+    std::vector<std::pair<size_t, std::string>> copy2_many(
+            const std::vector<std::pair<fs::path, fs::path>>& pairs) {
+        std::vector<std::pair<size_t, std::string>> failures;
+        for (size_t i = 0; i < pairs.size(); ++i) {
+            const fs::path& src = pairs[i].first;
+            const fs::path& dst = pairs[i].second;
+            try {
+                copy_single_file(src, dst, true,
+                                 "Failed to copy file with metadata: " + display_path(src) + " to " + display_path(dst));
+            } catch (const std::exception& e) {
+                failures.emplace_back(i, e.what());
+            }
+        }
+        return failures;
     }
 
     // Copy with server
-    void copy_with_server(const std::string& src, const std::string& dst, 
+    void copy_with_server(const fs::path& src, const fs::path& dst, 
                          const std::string& server_addr, 
                          int port = 31337,
                          int compression_level = 0) {
@@ -170,7 +209,7 @@ public:
         fs::path dst_path(dst);
 
         if (!fs::exists(src_path)) {
-            throw std::runtime_error("Source does not exist: " + src);
+            throw std::runtime_error("Source does not exist: " + display_path(src));
         }
 
         // Create destination directory if it doesn't exist
@@ -193,90 +232,192 @@ public:
         client.SetCompressionLevel(compression_level);
         
         if (!client.DoCopy()) {
-            throw std::runtime_error("Failed to copy with server: " + src + " to " + dst);
+            throw std::runtime_error("Failed to copy with server: " + display_path(src) + " to " + display_path(dst));
         }
     }
+
+private:
+    // Copy a single file. On Linux and macOS the data is copied by the kernel
+    // (copy_file_range/sendfile/fcopyfile); elsewhere EACopy does the copy.
+    void copy_single_file(const fs::path& src_path, const fs::path& dst_path,
+                          bool preserve_metadata, const std::string& error_message) {
+#if EACOPY_HAS_NATIVE_COPY
+        (void)error_message;
+        eacopy_native::copy_file(src_path, dst_path, preserve_metadata, buffer_size_);
+#else
+        std::error_code ec;
+        if (fs::equivalent(src_path, dst_path, ec)) {
+            throw std::runtime_error("Source and destination are the same file: " + display_path(src_path) +
+                                     " and " + display_path(dst_path));
+        }
+
+        EACopyClient client;
+        client.SetSource(src_path.string().c_str());
+        client.SetDestination(dst_path.string().c_str());
+        if (preserve_metadata) {
+            client.SetCopyFlags(EACOPY_COPY_DATA | EACOPY_COPY_ATTRIBUTES | EACOPY_COPY_TIMESTAMPS);
+        } else {
+            client.SetCopyFlags(EACOPY_COPY_DATA);
+        }
+
+        if (!client.DoCopy()) {
+            throw std::runtime_error(error_message);
+        }
+#endif
+    }
+
+#if EACOPY_HAS_NATIVE_COPY
+    // Recursively copy the contents of src_dir into the existing dst_dir
+    void copy_tree_native(const fs::path& src_dir, const fs::path& dst_dir,
+                          bool symlinks, bool ignore_dangling_symlinks) {
+        for (const fs::directory_entry& entry : fs::directory_iterator(src_dir)) {
+            fs::path target = dst_dir / entry.path().filename();
+
+            if (entry.is_symlink()) {
+                if (symlinks) {
+                    fs::copy_symlink(entry.path(), target);
+                    continue;
+                }
+                if (!fs::exists(entry.path())) {
+                    if (ignore_dangling_symlinks) {
+                        continue;
+                    }
+                    throw std::runtime_error("Dangling symlink: " + display_path(entry.path()));
+                }
+            }
+
+            if (entry.is_directory()) {
+                eacopy_native::create_directory(target);
+                copy_tree_native(entry.path(), target, symlinks, ignore_dangling_symlinks);
+                // Copied last: writing the entries updates the directory's
+                // times, and a read-only mode would have kept them out
+                eacopy_native::copy_directory_metadata(entry.path(), target);
+            } else {
+                eacopy_native::copy_file(entry.path(), target, true, buffer_size_);
+            }
+        }
+    }
+#endif
+
+    // Size of the I/O buffers used when the kernel cannot copy directly.
+    // Instances hold no other state, so one can be shared between threads.
+    const size_t buffer_size_;
 };
 
+// Instance shared by the standalone functions, so that they do not construct
+// and destroy an EACopy object on every call
+EACopy& default_eacopy() {
+    static EACopy instance;
+    return instance;
+}
+
 // Standalone functions that use the EACopy class
-void copyfile(const std::string& src, const std::string& dst) {
-    EACopy eacopy;
-    eacopy.copyfile(src, dst);
+void copyfile(const fs::path& src, const fs::path& dst) {
+    default_eacopy().copyfile(src, dst);
 }
 
-void copy(const std::string& src, const std::string& dst) {
-    EACopy eacopy;
-    eacopy.copy(src, dst);
+void copy(const fs::path& src, const fs::path& dst) {
+    default_eacopy().copy(src, dst);
 }
 
-void copy2(const std::string& src, const std::string& dst) {
-    EACopy eacopy;
-    eacopy.copy2(src, dst);
+void copy2(const fs::path& src, const fs::path& dst) {
+    default_eacopy().copy2(src, dst);
 }
 
-void copytree(const std::string& src, const std::string& dst, 
+void copytree(const fs::path& src, const fs::path& dst, 
               bool symlinks = false, 
               bool ignore_dangling_symlinks = false,
               bool dirs_exist_ok = false) {
-    EACopy eacopy;
-    eacopy.copytree(src, dst, symlinks, ignore_dangling_symlinks, dirs_exist_ok);
+    default_eacopy().copytree(src, dst, symlinks, ignore_dangling_symlinks, dirs_exist_ok);
+}
+
+std::vector<std::pair<size_t, std::string>> copy2_many(
+        const std::vector<std::pair<fs::path, fs::path>>& pairs) {
+    return default_eacopy().copy2_many(pairs);
 }
 
-void copy_with_server(const std::string& src, const std::string& dst, 
+void copy_with_server(const fs::path& src, const fs::path& dst, 
                      const std::string& server_addr, 
                      int port = 31337,
                      int compression_level = 0) {
-    EACopy eacopy;
-    eacopy.copy_with_server(src, dst, server_addr, port, compression_level);
+    default_eacopy().copy_with_server(src, dst, server_addr, port, compression_level);
 }
 
 // Initialize the bindings
 void init_eacopy_binding(py::module& m) {
-    // Bind the EACopy class
+    // Bind the EACopy class. The GIL is released while copying so that
+    // copies can run in parallel from Python threads.
     py::class_<EACopy>(m, "EACopy")
-        .def(py::init<>())
+        .def(py::init<size_t>(),
+             py::arg("buffer_size") = eacopy_native::kDefaultBufferSize,
+             "Create an EACopy instance. buffer_size is the size of the I/O buffers "
+             "used when data cannot be copied by the kernel directly")
         .def("copyfile", &EACopy::copyfile, 
              py::arg("src"), py::arg("dst"),
-             "Copy file content from src to dst")
+             "Copy file content from src to dst",
+             py::call_guard<py::gil_scoped_release>())
         .def("copy", &EACopy::copy, 
              py::arg("src"), py::arg("dst"),
-             "Copy file from src to dst, preserving file content but not metadata")
+             "Copy file from src to dst, preserving file content but not metadata",
+             py::call_guard<py::gil_scoped_release>())
         .def("copy2", &EACopy::copy2, 
              py::arg("src"), py::arg("dst"),
-             "Copy file from src to dst, preserving file content and metadata")
+             "Copy file from src to dst, preserving file content and metadata",
+             py::call_guard<py::gil_scoped_release>())
         .def("copytree", &EACopy::copytree, 
              py::arg("src"), py::arg("dst"), 
              py::arg("symlinks") = false, 
              py::arg("ignore_dangling_symlinks") = false,
              py::arg("dirs_exist_ok") = false,
-             "Recursively copy a directory tree from src to dst")
+             "Recursively copy a directory tree from src to dst",
+             py::call_guard<py::gil_scoped_release>())
+        .def("copy2_many", &EACopy::copy2_many,
+             py::arg("pairs"),
+             "Copy (src, dst) file pairs with metadata, returning (index, error) for failures",
+             py::call_guard<py::gil_scoped_release>())
         .def("copy_with_server", &EACopy::copy_with_server, 
              py::arg("src"), py::arg("dst"), 
              py::arg("server_addr"), 
              py::arg("port") = 31337,
              py::arg("compression_level") = 0,
-             "Copy file or directory using EACopyService for acceleration");
+             "Copy file or directory using EACopyService for acceleration",
+             py::call_guard<py::gil_scoped_release>());
 
     // Bind standalone functions
     m.def("copyfile", &copyfile, 
           py::arg("src"), py::arg("dst"),
-          "Copy file content from src to dst");
+          "Copy file content from src to dst",
+          py::call_guard<py::gil_scoped_release>());
     m.def("copy", &copy, 
           py::arg("src"), py::arg("dst"),
-          "Copy file from src to dst, preserving file content but not metadata");
+          "Copy file from src to dst, preserving file content but not metadata",
+          py::call_guard<py::gil_scoped_release>());
     m.def("copy2", &copy2, 
           py::arg("src"), py::arg("dst"),
-          "Copy file from src to dst, preserving file content and metadata");
+          "Copy file from src to dst, preserving file content and metadata",
+          py::call_guard<py::gil_scoped_release>());
     m.def("copytree", &copytree, 
           py::arg("src"), py::arg("dst"), 
           py::arg("symlinks") = false, 
           py::arg("ignore_dangling_symlinks") = false,
           py::arg("dirs_exist_ok") = false,
-          "Recursively copy a directory tree from src to dst");
+          "Recursively copy a directory tree from src to dst",
+          py::call_guard<py::gil_scoped_release>());
+    m.def("copy2_many", &copy2_many,
+          py::arg("pairs"),
+          "Copy (src, dst) file pairs with metadata, returning (index, error) for failures",
+          py::call_guard<py::gil_scoped_release>());
     m.def("copy_with_server", &copy_with_server, 
           py::arg("src"), py::arg("dst"), 
           py::arg("server_addr"), 
           py::arg("port") = 31337,
           py::arg("compression_level") = 0,
-          "Copy file or directory using EACopyService for acceleration");
+          "Copy file or directory using EACopyService for acceleration",
+          py::call_guard<py::gil_scoped_release>());
+
+#if EACOPY_HAS_NATIVE_COPY
+    // Private: lets the tests check which buffers the native copy keeps
+    m.def("_pooled_buffer_bytes", &eacopy_native::pooled_buffer_bytes,
+          "Return the total size of the idle I/O buffers kept for reuse");
+#endif
 }
@@ -0,0 +1,383 @@
+#include "native_copy.h"
+
+#if EACOPY_HAS_NATIVE_COPY
+
+#include <algorithm>
+#include <cerrno>
+#include <cstring>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <fcntl.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#if defined(__linux__)
+#include <sys/sendfile.h>
+#include <sys/syscall.h>
+#elif defined(__APPLE__)
+#include <copyfile.h>
+#endif
+
+#if defined(__linux__) && !defined(__NR_copy_file_range)
+// Older kernel headers (e.g. manylinux2014) do not know about copy_file_range
+#if defined(__x86_64__)
+#define __NR_copy_file_range 326
+#elif defined(__aarch64__)
+#define __NR_copy_file_range 285
+#endif
+#endif
+
+namespace fs = std::filesystem;
+
+namespace eacopy_native {
+namespace {
+
+// Number of idle buffers kept for reuse. Only buffers up to
+// kDefaultBufferSize are kept, so the pool holds at most 16 MiB.
+constexpr size_t kMaxPooledBuffers = 16;
+
+#if defined(__linux__)
+// Largest count a single sendfile()/copy_file_range() call will transfer
+constexpr size_t kMaxKernelCopyChunk = 0x7ffff000;
+#endif
+
+// Closes the wrapped file descriptor when it goes out of scope
+class FileDescriptor {
+public:
+    explicit FileDescriptor(int fd) : fd_(fd) {}
+    ~FileDescriptor() {
+        if (fd_ >= 0) {
+            ::close(fd_);
+        }
+    }
+
+    FileDescriptor(const FileDescriptor&) = delete;
+    FileDescriptor& operator=(const FileDescriptor&) = delete;
+
+    int get() const { return fd_; }
+
+    // Close the descriptor, reporting errors from deferred writes
+    int close() {
+        int result = ::close(fd_);
+        fd_ = -1;
+        return result;
+    }
+
+private:
+    int fd_;
+};
+
+// An I/O buffer. The memory is left uninitialized: it is always written by
+// read() before being used, so zero-filling it would be wasted work.
+struct Buffer {
+    std::unique_ptr<char[]> data;
+    size_t size = 0;
+};
+
+// Pool of reusable I/O buffers. Copying many files would otherwise allocate,
+// page-fault and free a fresh buffer for every file. Buffers are not cleared
+// when returned: they only ever hold file data this process already read.
+class BufferPool {
+public:
+    Buffer acquire(size_t size) {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            for (auto it = free_.begin(); it != free_.end(); ++it) {
+                if (it->size >= size) {
+                    Buffer buffer = std::move(*it);
+                    free_.erase(it);
+                    return buffer;
+                }
+            }
+        }
+        return Buffer{std::unique_ptr<char[]>(new char[size]), size};
+    }
+
+    void release(Buffer buffer) {
+        // Larger buffers come from instances with a custom buffer_size and
+        // are freed here, so one such copy does not pin them for the
+        // lifetime of the process
+        if (buffer.size > kDefaultBufferSize) {
+            return;
+        }
+        std::lock_guard<std::mutex> lock(mutex_);
+        if (free_.size() < kMaxPooledBuffers) {
+            free_.push_back(std::move(buffer));
+        }
+    }
+
+    size_t idle_bytes() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        size_t total = 0;
+        for (const Buffer& buffer : free_) {
+            total += buffer.size;
+        }
+        return total;
+    }
+
+private:
+    std::mutex mutex_;
+    std::vector<Buffer> free_;
+};
+
+BufferPool& buffer_pool() {
+    static BufferPool pool;
+    return pool;
+}
+
+// Borrows a buffer from the pool and returns it when going out of scope
+class PooledBuffer {
+public:
+    explicit PooledBuffer(size_t size) : buffer_(buffer_pool().acquire(size)), size_(size) {}
+    ~PooledBuffer() { buffer_pool().release(std::move(buffer_)); }
+
+    PooledBuffer(const PooledBuffer&) = delete;
+    PooledBuffer& operator=(const PooledBuffer&) = delete;
+
+    char* data() { return buffer_.data.get(); }
+    size_t size() const { return size_; }
+
+private:
+    Buffer buffer_;
+    size_t size_;
+};
+
+[[noreturn]] void throw_errno(const std::string& what, const fs::path& path) {
+    throw std::runtime_error(what + ": " + path.string() + " (" + std::strerror(errno) + ")");
+}
+
+// Copy through a userspace buffer; used when the kernel cannot copy directly
+void copy_with_read_write(int in_fd, int out_fd, size_t buffer_size, const fs::path& src, const fs::path& dst) {
+    PooledBuffer buffer(buffer_size);
+    for (;;) {
+        ssize_t count = ::read(in_fd, buffer.data(), buffer.size());
+        if (count == 0) {
+            return;
+        }
+        if (count < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            throw_errno("Failed to read file", src);
+        }
+
+        const char* data = buffer.data();
+        while (count > 0) {
+            ssize_t written = ::write(out_fd, data, static_cast<size_t>(count));
+            if (written < 0) {
+                if (errno == EINTR) {
+                    continue;
+                }
+                throw_errno("Failed to write file", dst);
+            }
+            data += written;
+            count -= written;
+        }
+    }
+}
+
+#if defined(__linux__)
+// Copy with copy_file_range() so the filesystem can reflink or copy the data
+// server side. Returns false, having copied nothing, if it is not supported
+// for these descriptors or the first call copies no data. It is called
+// through syscall() so wheels built against an old glibc still use it on
+// kernels that provide it.
+bool copy_with_copy_file_range(int in_fd, int out_fd, off_t size, const fs::path& src) {
+#if defined(__NR_copy_file_range)
+    off_t copied = 0;
+    while (copied < size) {
+        size_t count = static_cast<size_t>(std::min<off_t>(size - copied, kMaxKernelCopyChunk));
+        ssize_t result = ::syscall(__NR_copy_file_range, in_fd, nullptr, out_fd, nullptr, count, 0u);
+        if (result < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            if ((errno == ENOSYS || errno == EXDEV || errno == EINVAL || errno == EOPNOTSUPP) && copied == 0) {
+                return false;
+            }
+            throw_errno("Failed to copy file", src);
+        }
+        if (result == 0) {
+            if (copied == 0) {
+                // Some kernels return 0 straight away for files whose st_size
+                // is not their real size (e.g. procfs/sysfs), so let the
+                // caller fall back to another method
+                return false;
+            }
+            // The source was truncated while we were copying it
+            break;
+        }
+        copied += result;
+    }
+    return true;
+#else
+    (void)in_fd;
+    (void)out_fd;
+    (void)size;
+    (void)src;
+    return false;
+#endif
+}
+
+// Copy with sendfile() so the data never leaves the kernel. Returns false,
+// having copied nothing, if sendfile() is not supported for these descriptors
+// or the first call copies no data.
+bool copy_with_sendfile(int in_fd, int out_fd, off_t size, const fs::path& src) {
+    off_t offset = 0;
+    while (offset < size) {
+        size_t count = static_cast<size_t>(std::min<off_t>(size - offset, kMaxKernelCopyChunk));
+        ssize_t sent = ::sendfile(out_fd, in_fd, &offset, count);
+        if (sent < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            if ((errno == EINVAL || errno == ENOSYS) && offset == 0) {
+                return false;
+            }
+            throw_errno("Failed to copy file", src);
+        }
+        if (sent == 0) {
+            if (offset == 0) {
+                // Nothing could be copied, as with copy_file_range() above
+                return false;
+            }
+            // The source was truncated while we were copying it
+            break;
+        }
+    }
+    return true;
+}
+#endif
+
+void copy_data(int in_fd, int out_fd, const struct stat& src_stat, size_t buffer_size,
+               const fs::path& src, const fs::path& dst) {
+#if defined(__linux__)
+    // Files reporting a zero size (e.g. procfs) may still have content, so
+    // only trust st_size for the in-kernel copies when it is non-zero
+    if (src_stat.st_size > 0) {
+        if (copy_with_copy_file_range(in_fd, out_fd, src_stat.st_size, src) ||
+            copy_with_sendfile(in_fd, out_fd, src_stat.st_size, src)) {
+            return;
+        }
+    }
+#elif defined(__APPLE__)
+    (void)src_stat;
+    if (::fcopyfile(in_fd, out_fd, nullptr, COPYFILE_DATA) == 0) {
+        return;
+    }
+#endif
+    copy_with_read_write(in_fd, out_fd, buffer_size, src, dst);
+}
+
+// Fill times with the access and modification times of st, in the form
+// futimens()/utimensat() take them
+void get_times(const struct stat& st, struct timespec times[2]) {
+#if defined(__APPLE__)
+    times[0] = st.st_atimespec;
+    times[1] = st.st_mtimespec;
+#else
+    times[0] = st.st_atim;
+    times[1] = st.st_mtim;
+#endif
+}
+
+void copy_metadata(int out_fd, const struct stat& src_stat, const fs::path& dst) {
+    if (::fchmod(out_fd, src_stat.st_mode & 07777) != 0) {
+        throw_errno("Failed to copy permissions", dst);
+    }
+
+    struct timespec times[2];
+    get_times(src_stat, times);
+    if (::futimens(out_fd, times) != 0) {
+        throw_errno("Failed to copy timestamps", dst);
+    }
+}
+
+}  // namespace
+
+void copy_file(const fs::path& src, const fs::path& dst, bool preserve_metadata, size_t buffer_size) {
+    // O_NONBLOCK keeps open() from waiting for a writer if src is a FIFO
+    FileDescriptor in_fd(::open(src.c_str(), O_RDONLY | O_NONBLOCK | O_CLOEXEC));
+    if (in_fd.get() < 0) {
+        throw_errno("Failed to open source file", src);
+    }
+
+    struct stat src_stat;
+    if (::fstat(in_fd.get(), &src_stat) != 0) {
+        throw_errno("Failed to stat source file", src);
+    }
+
+    // Reading a FIFO, socket or device would block or never end
+    if (S_ISFIFO(src_stat.st_mode)) {
+        throw std::runtime_error("Source is a named pipe: " + src.string());
+    }
+    if (!S_ISREG(src_stat.st_mode)) {
+        throw std::runtime_error("Source is not a regular file: " + src.string());
+    }
+
+    // Restore blocking reads for the copy itself
+    int flags = ::fcntl(in_fd.get(), F_GETFL);
+    if (flags < 0 || ::fcntl(in_fd.get(), F_SETFL, flags & ~O_NONBLOCK) != 0) {
+        throw_errno("Failed to configure source file", src);
+    }
+
+    // Opening dst truncates it, which would destroy the source if both name
+    // the same file
+    struct stat dst_stat;
+    if (::stat(dst.c_str(), &dst_stat) == 0 && dst_stat.st_dev == src_stat.st_dev &&
+        dst_stat.st_ino == src_stat.st_ino) {
+        throw std::runtime_error("Source and destination are the same file: " + src.string() + " and " +
+                                 dst.string());
+    }
+
+    FileDescriptor out_fd(::open(dst.c_str(), O_WRONLY | O_CREAT | O_TRUNC | O_CLOEXEC, 0666));
+    if (out_fd.get() < 0) {
+        throw_errno("Failed to open destination file", dst);
+    }
+
+    copy_data(in_fd.get(), out_fd.get(), src_stat, buffer_size, src, dst);
+
+    if (preserve_metadata) {
+        copy_metadata(out_fd.get(), src_stat, dst);
+    }
+
+    if (out_fd.close() != 0) {
+        throw_errno("Failed to close destination file", dst);
+    }
+}
+
+size_t pooled_buffer_bytes() {
+    return buffer_pool().idle_bytes();
+}
+
+void create_directory(const fs::path& dst) {
+    if (::mkdir(dst.c_str(), 0700) != 0 && errno != EEXIST) {
+        throw_errno("Failed to create directory", dst);
+    }
+}
+
+void copy_directory_metadata(const fs::path& src, const fs::path& dst) {
+    struct stat src_stat;
+    if (::stat(src.c_str(), &src_stat) != 0) {
+        throw_errno("Failed to stat source directory", src);
+    }
+
+    if (::chmod(dst.c_str(), src_stat.st_mode & 07777) != 0) {
+        throw_errno("Failed to copy permissions", dst);
+    }
+
+    struct timespec times[2];
+    get_times(src_stat, times);
+    if (::utimensat(AT_FDCWD, dst.c_str(), times, 0) != 0) {
+        throw_errno("Failed to copy timestamps", dst);
+    }
+}
+
+}  // namespace eacopy_native
+
+#endif  // EACOPY_HAS_NATIVE_COPY
@@ -0,0 +1,40 @@
+#pragma once
+
+#include <cstddef>
+#include <filesystem>
+
+// Platforms where file data can be copied inside the kernel instead of
+// bouncing it through a userspace read()/write() loop
+#if defined(__linux__) || defined(__APPLE__)
+#define EACOPY_HAS_NATIVE_COPY 1
+#else
+#define EACOPY_HAS_NATIVE_COPY 0
+#endif
+
+namespace eacopy_native {
+
+// Default size of the buffers used when data has to go through userspace
+constexpr size_t kDefaultBufferSize = 1024 * 1024;
+
+// Copy the content of src to dst, truncating dst if it already exists.
+// When preserve_metadata is set, permission bits and timestamps are copied
+// as well. buffer_size is the size of the I/O buffer used if the kernel
+// cannot copy the data directly. Throws std::runtime_error on failure,
+// including when src and dst are the same file.
+void copy_file(const std::filesystem::path& src,
+               const std::filesystem::path& dst,
+               bool preserve_metadata,
+               size_t buffer_size = kDefaultBufferSize);
+
+// Total size of the idle I/O buffers kept for reuse, for tests
+size_t pooled_buffer_bytes();
+
+// Create the directory dst, unless it already exists. It is created private
+// (mode 0700) until copy_directory_metadata() gives it its final mode.
+void create_directory(const std::filesystem::path& dst);
+
+// Copy the permission bits and timestamps of the directory src to dst.
+// Throws std::runtime_error on failure.
+void copy_directory_metadata(const std::filesystem::path& src, const std::filesystem::path& dst);
+
+}  // namespace eacopy_native
@@ -1,29 +1,46 @@
 """Python bindings for EACopy, a high-performance file copy tool."""
 
 # Import built-in modules
-import os
-import sys
-from typing import Optional, Union
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+from typing import List as _List
 
 # Import local modules
 from .__version__ import __version__
-
-# Import C++ bindings
-from ._eacopy_binding import (
-    EACopy,
-    copy,
-    copy2,
-    copyfile,
-    copytree,
-    copy_with_server,
-    __eacopy_version__,
-)
-
 from .config import Config
 
-# Initialize global configuration
+if _TYPE_CHECKING:
+    from ._eacopy_binding import (
+        EACopy,
+        copy,
+        copy2,
+        copyfile,
+        copy_with_server,
+        __eacopy_version__,
+    )
+    from .session import Session
+    from .tree import copytree
+
+# Initialize global configuration. It is created here rather than on first
+# access, so that importing the ``eacopy.config`` submodule (which binds it
+# as the package's ``config`` attribute on first load) cannot replace it.
 config = Config()
 
+# Public names and the submodule providing them. They are imported on first
+# access, so that importing the package (e.g. for ``eacopy --help``) does not
+# load the C++ extension.
+_LAZY_ATTRIBUTES = {
+    "EACopy": "._eacopy_binding",
+    "copy": "._eacopy_binding",
+    "copy2": "._eacopy_binding",
+    "copyfile": "._eacopy_binding",
+    "copy_with_server": "._eacopy_binding",
+    "__eacopy_version__": "._eacopy_binding",
+    "Session": ".session",
+    "copytree": ".tree",
+}
+
 __all__ = [
     "__version__",
     "__eacopy_version__",
@@ -35,4 +52,22 @@ __all__ = [
     "copy_with_server",
     "Config",
     "EACopy",
+    "Session",
 ]
+
+
+def __getattr__(name: str) -> _Any:
+    """Import public names on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_importlib.import_module(module_name, __name__), name)
+    # Cache the value so that later lookups do not come back here
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _List[str]:
+    """List the public names, including those not imported yet."""
+    return list(__all__)
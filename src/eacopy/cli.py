@@ -7,7 +7,9 @@ import sys
 import click
 
 # Import local modules
-from . import __version__, copy, copy2, copytree, copy_with_server
+# The copy functions are imported inside each command, so that --help and
+# --version do not load the C++ extension
+from . import __version__
 
 
 @click.group()
@@ -25,6 +27,8 @@ def cli():
 )
 def cp(source, destination, preserve_metadata):
     """Copy a file from SOURCE to DESTINATION."""
+    from . import copy, copy2
+
     try:
         if preserve_metadata:
             copy2(source, destination)
@@ -44,6 +48,8 @@ def cp(source, destination, preserve_metadata):
 @click.option("--dirs-exist-ok", "-d", is_flag=True, help="Allow destination directory to exist")
 def cptree(source, destination, symlinks, ignore_dangling_symlinks, dirs_exist_ok):
     """Copy a directory tree from SOURCE to DESTINATION."""
+    from . import copytree
+
     try:
         copytree(
             source,
@@ -66,6 +72,8 @@ def cptree(source, destination, symlinks, ignore_dangling_symlinks, dirs_exist_o
 @click.option("--compression", "-c", type=int, default=0, help="Compression level (0-9)")
 def server(source, destination, server_addr, port, compression):
     """Copy using EACopyService from SOURCE to DESTINATION via SERVER_ADDR."""
+    from . import copy_with_server
+
     try:
         copy_with_server(
             source,
@@ -0,0 +1,140 @@
+"""Copying many files through an EACopyService."""
+
+# Import built-in modules
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+import os
+from types import TracebackType
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+# Import local modules
+from ._eacopy_binding import copy_with_server
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class Session:
+    """A connection profile for copying many files through one EACopyService.
+
+    Each ``copy_with_server`` call waits for the service to finish before it
+    returns, so copying files one after another pays a full round trip per
+    file. A session keeps up to ``streams`` transfers in flight at once, so
+    the round trips overlap with each other and with the data transfer.
+
+    Example:
+        >>> with eacopy.Session("localhost", 31337, streams=8) as session:
+        ...     session.copy_many([("a.txt", "b.txt"), ("src_dir", "dst_dir")])
+
+    Attributes:
+        server_addr: Address of the EACopyService.
+        port: Port of the EACopyService.
+        streams: Maximum number of transfers in flight at the same time.
+        compression_level: Compression level (0-9) for the transfers.
+
+    """
+
+    def __init__(
+        self,
+        server_addr: str,
+        port: int = 31337,
+        streams: int = 8,
+        compression_level: int = 0,
+    ) -> None:
+        """Initialize the session.
+
+        Args:
+            server_addr: Address of the EACopyService.
+            port: Port of the EACopyService.
+            streams: Maximum number of transfers in flight at the same time.
+            compression_level: Compression level (0-9) for the transfers.
+
+        Raises:
+            ValueError: If streams is less than 1.
+
+        """
+        if streams < 1:
+            raise ValueError(f"streams must be at least 1, got {streams}")
+
+        self.server_addr = server_addr
+        self.port = port
+        self.streams = streams
+        self.compression_level = compression_level
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "Session":
+        """Start the session."""
+        self._get_executor()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the session."""
+        self.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.streams, thread_name_prefix="eacopy-session")
+        return self._executor
+
+    def close(self) -> None:
+        """Wait for pending transfers and release the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def copy(self, src: PathLike, dst: PathLike) -> None:
+        """Copy a file or directory tree through the service.
+
+        Args:
+            src: Source file or directory.
+            dst: Destination file or directory.
+
+        Raises:
+            RuntimeError: If the copy fails.
+
+        """
+        self.copy_many([(src, dst)])
+
+    def copy_many(self, pairs: Iterable[Tuple[PathLike, PathLike]]) -> None:
+        """Copy several files or directory trees through the service.
+
+        All transfers are attempted, even if some of them fail.
+
+        Args:
+            pairs: (src, dst) pairs to copy.
+
+        Raises:
+            RuntimeError: If any of the copies fails.
+
+        """
+        executor = self._get_executor()
+        futures: Dict[Future[None], str] = {}
+        for src, dst in pairs:
+            src = os.fspath(src)
+            future = executor.submit(
+                copy_with_server, src, os.fspath(dst), self.server_addr, self.port, self.compression_level
+            )
+            futures[future] = src
+
+        errors: List[Tuple[str, str]] = []
+        for future in as_completed(futures):
+            exc = future.exception()
+            if exc is not None:
+                errors.append((futures[future], str(exc)))
+
+        if errors:
+            # Sort so the message does not depend on completion order
+            errors.sort()
+            details = "; ".join(f"{path}: {message}" for path, message in errors)
+            raise RuntimeError(f"Failed to copy with server {self.server_addr}:{self.port} ({details})")
@@ -0,0 +1,268 @@
+"""Parallel directory tree copying."""
+
+# Import built-in modules
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import ExitStack
+from contextlib import contextmanager
+import os
+import shutil
+import threading
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# Import local modules
+from ._eacopy_binding import copy2_many
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Files at least this large go to the large file queue
+LARGE_FILE_THRESHOLD = 1024 * 1024
+
+# Number of small files handed to the binding in one call. Batching pays the
+# Python/C++ crossing and GIL hand-off once per batch instead of once per file,
+# while keeping batches small enough to spread a tree across the workers.
+SMALL_FILE_BATCH_SIZE = 8
+
+# Upper bound on workers serving the large file queue. Bulk copies are
+# throughput bound, so a few streams are enough to saturate the device.
+LARGE_FILE_WORKERS = 4
+
+
+class _Pool:
+    """A worker pool shared by copytree() calls, with the number of calls using it."""
+
+    def __init__(self, queue: str, max_workers: int) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"eacopy-{queue}")
+        self.max_workers = max_workers
+        self.users = 0
+
+
+# Worker pools shared by all copytree() calls, one per queue
+_executors: Dict[str, _Pool] = {}
+_executors_lock = threading.Lock()
+
+
+def _reset_executors_after_fork() -> None:
+    """Forget the worker pools inherited by a forked child.
+
+    Only the forking thread survives fork(), so the pools' worker threads do
+    not exist in the child, and the lock may have been held by another
+    thread. The child starts its own pools on its first copytree() call.
+    """
+    global _executors_lock
+    _executors.clear()
+    _executors_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executors_after_fork)
+
+
+def default_max_concurrency() -> int:
+    """Return the default number of files copied at the same time.
+
+    Each in-flight copy holds two file descriptors, so the value is capped to
+    keep the descriptor budget small.
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+@contextmanager
+def _borrow_executor(queue: str, max_workers: int) -> Iterator[ThreadPoolExecutor]:
+    """Use the shared worker pool of a queue, creating it on first use.
+
+    Pools are kept between calls, so repeated copytree() calls do not pay for
+    starting and joining their worker threads. A call asking for a different
+    number of workers replaces the pool of its queue, and the old pool is shut
+    down once the calls still using it are done, so at most one idle pool per
+    queue is kept alive.
+    """
+    with _executors_lock:
+        pool = _executors.get(queue)
+        if pool is None or pool.max_workers != max_workers:
+            if pool is not None and not pool.users:
+                pool.executor.shutdown(wait=False)
+            pool = _Pool(queue, max_workers)
+            _executors[queue] = pool
+        pool.users += 1
+    try:
+        yield pool.executor
+    finally:
+        with _executors_lock:
+            pool.users -= 1
+            if not pool.users and _executors.get(queue) is not pool:
+                pool.executor.shutdown(wait=False)
+
+
+def _is_same_or_inside(path: str, directory: str) -> bool:
+    """Return whether path is directory or lies below it, after resolving symlinks."""
+    path = os.path.realpath(path)
+    directory = os.path.realpath(directory)
+    try:
+        return os.path.commonpath([path, directory]) == directory
+    except ValueError:
+        # Paths on different drives
+        return False
+
+
+def _walk(
+    src: str,
+    dst: str,
+    symlinks: bool,
+    ignore_dangling_symlinks: bool,
+    dirs: List[Tuple[str, str]],
+) -> Iterator[Tuple[str, str, int]]:
+    """Create the directories below dst and yield the files to copy with their size.
+
+    Directories are created here, before any file inside them is submitted,
+    so that worker threads never race on directory creation. They are created
+    private and appended to dirs as (src, dst) pairs, so that their metadata
+    can be copied once their content is in place.
+    """
+    with os.scandir(src) as it:
+        entries = list(it)
+
+    for entry in entries:
+        dst_path = os.path.join(dst, entry.name)
+
+        if entry.is_symlink():
+            if symlinks:
+                os.symlink(os.readlink(entry.path), dst_path)
+                continue
+            if not os.path.exists(entry.path):
+                if ignore_dangling_symlinks:
+                    continue
+                raise RuntimeError(f"Dangling symlink: {entry.path}")
+
+        if entry.is_dir():
+            os.makedirs(dst_path, mode=0o700, exist_ok=True)
+            dirs.append((entry.path, dst_path))
+            yield from _walk(entry.path, dst_path, symlinks, ignore_dangling_symlinks, dirs)
+        elif entry.is_file():
+            yield entry.path, dst_path, entry.stat().st_size
+        else:
+            # Reading a FIFO, socket or device would block a worker or never end
+            raise RuntimeError(f"Not a regular file: {entry.path}")
+
+
+def copytree(
+    src: PathLike,
+    dst: PathLike,
+    symlinks: bool = False,
+    ignore_dangling_symlinks: bool = False,
+    dirs_exist_ok: bool = False,
+    max_concurrency: Optional[int] = None,
+) -> None:
+    """Recursively copy a directory tree from src to dst.
+
+    Files and directories are copied with their permission bits and
+    timestamps. Files are copied by worker threads, so per-file latency
+    (open, stat, close) overlaps across files. Files smaller than
+    ``LARGE_FILE_THRESHOLD`` are served by a wide pool, since their cost is
+    dominated by syscall latency. Larger files are served by a small separate
+    pool, so they keep streaming without being starved by, or starving, the
+    small files.
+
+    The worker pools are started on the first call and reused by later calls
+    with the same ``max_concurrency``. A call with a different value replaces
+    them, and the old pools are shut down.
+
+    Args:
+        src: Source directory.
+        dst: Destination directory.
+        symlinks: Copy symlinks as symlinks instead of copying their targets.
+        ignore_dangling_symlinks: Skip symlinks whose target does not exist.
+        dirs_exist_ok: Allow dst to exist already.
+        max_concurrency: Maximum number of files copied at the same time,
+            shared between the small and large file pools. Defaults to
+            ``default_max_concurrency()``.
+
+    Raises:
+        ValueError: If max_concurrency is less than 1.
+        RuntimeError: If the source is not a directory, the destination cannot
+            be used or lies inside the source, the tree contains a special
+            file (such as a named pipe), or any file fails to copy.
+
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+
+    if not os.path.exists(src):
+        raise RuntimeError(f"Source directory does not exist: {src}")
+    if not os.path.isdir(src):
+        raise RuntimeError(f"Source is not a directory: {src}")
+    if _is_same_or_inside(dst, src):
+        # The copy would be walked into as it is being created
+        raise RuntimeError(f"Cannot copy a directory into itself: {src} to {dst}")
+    if os.path.exists(dst):
+        if not os.path.isdir(dst):
+            raise RuntimeError(f"Destination exists and is not a directory: {dst}")
+        if not dirs_exist_ok:
+            raise RuntimeError(f"Destination directory already exists: {dst}")
+    os.makedirs(dst, mode=0o700, exist_ok=True)
+
+    if max_concurrency is None:
+        max_concurrency = default_max_concurrency()
+
+    # With fewer than four workers there is no room for a separate large file
+    # pool, and all files share the small file pool
+    large_workers = min(LARGE_FILE_WORKERS, max_concurrency // 4)
+    small_workers = max(1, max_concurrency - large_workers)
+
+    errors: List[Tuple[str, str]] = []
+    dirs: List[Tuple[str, str]] = [(src, dst)]
+    futures: Dict[Future[List[Tuple[int, str]]], List[Tuple[str, str]]] = {}
+    with ExitStack() as stack:
+        small_executor = stack.enter_context(_borrow_executor("small", small_workers))
+        if large_workers:
+            large_executor = stack.enter_context(_borrow_executor("large", large_workers))
+        else:
+            large_executor = small_executor
+        try:
+            batch: List[Tuple[str, str]] = []
+            for src_path, dst_path, size in _walk(src, dst, symlinks, ignore_dangling_symlinks, dirs):
+                if large_workers and size >= LARGE_FILE_THRESHOLD:
+                    pairs = [(src_path, dst_path)]
+                    futures[large_executor.submit(copy2_many, pairs)] = pairs
+                    continue
+
+                batch.append((src_path, dst_path))
+                if len(batch) == SMALL_FILE_BATCH_SIZE:
+                    futures[small_executor.submit(copy2_many, batch)] = batch
+                    batch = []
+            if batch:
+                futures[small_executor.submit(copy2_many, batch)] = batch
+        finally:
+            # The pools outlive this call, so wait for what was already submitted
+            # even if walking the tree failed part way through
+            for future in as_completed(futures):
+                pairs = futures[future]
+                exc = future.exception()
+                if exc is not None:
+                    errors.extend((src_path, str(exc)) for src_path, _ in pairs)
+                    continue
+                for index, message in future.result():
+                    errors.append((pairs[index][0], message))
+
+    # Copying files into a directory updates its times, and a read-only mode
+    # would have kept them out, so directory metadata is copied last
+    for src_dir, dst_dir in dirs:
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as exc:
+            errors.append((src_dir, str(exc)))
+
+    if errors:
+        # Sort so the message does not depend on completion order
+        errors.sort()
+        details = "; ".join(f"{path}: {message}" for path, message in errors)
+        raise RuntimeError(f"Failed to copy directory tree: {src} to {dst} ({details})")
@@ -0,0 +1,104 @@
+"""Shared pytest fixtures."""
+
+# Import built-in modules
+import os
+
+# Import third-party modules
+import pytest
+
+# Deterministic binary content covering every byte value, including \r and \n
+_BIN_BLOB = bytes((i * 131) & 0xFF for i in range(10 * 1024))
+
+# File name mixing several scripts, to exercise non-ASCII path handling
+_UNICODE_NAME = "unicode_测试_тест_テスト.txt"
+
+# O_BINARY keeps Windows from translating newlines
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _create_files(root, files):
+    """Create files below root from a mapping of relative path to bytes.
+
+    Each file is written with one write() on a raw descriptor, without going
+    through a buffered file object.
+    """
+    for name, content in files.items():
+        fd = os.open(os.path.join(root, name), _CREATE_FLAGS, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+
+
+# The source tree fixtures are session scoped: they are built once and only
+# ever read by the tests. Tests that need to modify a source tree build it in
+# ``source_dir`` instead.
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Return an empty source directory."""
+    path = tmp_path / "source"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def dest_dir(tmp_path):
+    """Return a destination path that does not exist yet."""
+    return tmp_path / "dest"
+
+
+@pytest.fixture(scope="session")
+def nested_dir_structure(tmp_path_factory):
+    """Create a small nested directory tree and return its root."""
+    root = tmp_path_factory.mktemp("nested")
+    # Creates subdir on the way
+    os.makedirs(root / "subdir" / "deep")
+
+    _create_files(
+        root,
+        {
+            "root.txt": b"root file",
+            os.path.join("subdir", "sub.txt"): b"sub file",
+            os.path.join("subdir", "deep", "deep.txt"): b"deep file",
+        },
+    )
+
+    return root
+
+
+@pytest.fixture(scope="session")
+def large_file(tmp_path_factory):
+    """Create a file big enough to go to the large file queue.
+
+    A small file is created next to it, so that its directory is a tree with
+    mixed file sizes.
+    """
+    root = tmp_path_factory.mktemp("mixed")
+    _create_files(root, {"small.txt": b"small file"})
+
+    # Only the size matters, so make it sparse instead of writing the data
+    file_path = root / "large.txt"
+    fd = os.open(file_path, _CREATE_FLAGS, 0o644)
+    try:
+        os.ftruncate(fd, 1024 * 1024)
+    finally:
+        os.close(fd)
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def unicode_filename(tmp_path_factory):
+    """Create a file with a non-ASCII name."""
+    root = tmp_path_factory.mktemp("unicode")
+    _create_files(root, {_UNICODE_NAME: b"unicode content"})
+    return root / _UNICODE_NAME
+
+
+@pytest.fixture(scope="session")
+def binary_file(tmp_path_factory):
+    """Create a file with binary content."""
+    root = tmp_path_factory.mktemp("binary")
+    _create_files(root, {"binary.bin": _BIN_BLOB})
+    return root / "binary.bin"
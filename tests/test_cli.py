@@ -1,104 +1,96 @@
 """Test CLI functionality."""
 
 # Import built-in modules
+import os
 import sys
 from unittest import mock
+
+# Import third-party modules
 from click.testing import CliRunner
+import pytest
 
 # Import local modules
 from eacopy import cli
 
 
-def test_cli_version():
+@pytest.fixture(scope="module")
+def runner():
+    """Return a CLI runner shared by the tests in this module."""
+    return CliRunner()
+
+
+@pytest.fixture
+def cli_fs(tmp_path, monkeypatch):
+    """Change into an empty directory holding a source.txt file."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "source.txt").write_bytes(b"test content")
+    return tmp_path
+
+
+def test_cli_version(runner):
     """Test CLI version command."""
-    runner = CliRunner()
     result = runner.invoke(cli.cli, ["--version"])
     assert result.exit_code == 0
     assert "version" in result.output.lower()
 
 
-@mock.patch("eacopy.cli.copy")
-def test_cli_cp(mock_copy):
+@mock.patch("eacopy.copy")
+def test_cli_cp(mock_copy, runner, cli_fs):
     """Test CLI cp command."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a test file
-        with open("source.txt", "w") as f:
-            f.write("test content")
-
-        result = runner.invoke(cli.cli, ["cp", "source.txt", "dest.txt"])
-        assert result.exit_code == 0
-        mock_copy.assert_called_once_with("source.txt", "dest.txt")
-        assert "Copied" in result.output
+    result = runner.invoke(cli.cli, ["cp", "source.txt", "dest.txt"])
+    assert result.exit_code == 0
+    mock_copy.assert_called_once_with("source.txt", "dest.txt")
+    assert "Copied" in result.output
 
 
-@mock.patch("eacopy.cli.copy2")
-def test_cli_cp_with_metadata(mock_copy2):
+@mock.patch("eacopy.copy2")
+def test_cli_cp_with_metadata(mock_copy2, runner, cli_fs):
     """Test CLI cp command with preserve metadata."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a test file
-        with open("source.txt", "w") as f:
-            f.write("test content")
-
-        result = runner.invoke(cli.cli, ["cp", "source.txt", "dest.txt", "--preserve-metadata"])
-        assert result.exit_code == 0
-        mock_copy2.assert_called_once_with("source.txt", "dest.txt")
-        assert "Copied" in result.output
+    result = runner.invoke(cli.cli, ["cp", "source.txt", "dest.txt", "--preserve-metadata"])
+    assert result.exit_code == 0
+    mock_copy2.assert_called_once_with("source.txt", "dest.txt")
+    assert "Copied" in result.output
 
 
-@mock.patch("eacopy.cli.copytree")
-def test_cli_cptree(mock_copytree):
+@mock.patch("eacopy.copytree")
+def test_cli_cptree(mock_copytree, runner, tmp_path, monkeypatch):
     """Test CLI cptree command."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a test directory
-        import os
-        os.makedirs("source_dir")
-
-        result = runner.invoke(cli.cli, ["cptree", "source_dir", "dest_dir"])
-        assert result.exit_code == 0
-        mock_copytree.assert_called_once_with(
-            "source_dir",
-            "dest_dir",
-            symlinks=False,
-            ignore_dangling_symlinks=False,
-            dirs_exist_ok=False,
-        )
-        assert "Copied directory tree" in result.output
-
-
-@mock.patch("eacopy.cli.copy_with_server")
-def test_cli_server(mock_copy_with_server):
+    monkeypatch.chdir(tmp_path)
+    # Create a test directory
+    os.makedirs("source_dir")
+
+    result = runner.invoke(cli.cli, ["cptree", "source_dir", "dest_dir"])
+    assert result.exit_code == 0
+    mock_copytree.assert_called_once_with(
+        "source_dir",
+        "dest_dir",
+        symlinks=False,
+        ignore_dangling_symlinks=False,
+        dirs_exist_ok=False,
+    )
+    assert "Copied directory tree" in result.output
+
+
+@mock.patch("eacopy.copy_with_server")
+def test_cli_server(mock_copy_with_server, runner, cli_fs):
     """Test CLI server command."""
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a test file
-        with open("source.txt", "w") as f:
-            f.write("test content")
-
-        result = runner.invoke(cli.cli, ["server", "source.txt", "dest.txt", "server.example.com"])
-        assert result.exit_code == 0
-        mock_copy_with_server.assert_called_once_with(
-            "source.txt",
-            "dest.txt",
-            "server.example.com",
-            port=31337,
-            compression_level=0,
-        )
-        assert "Copied" in result.output
-
-
-@mock.patch("eacopy.cli.copy")
-def test_cli_error(mock_copy):
+    result = runner.invoke(cli.cli, ["server", "source.txt", "dest.txt", "server.example.com"])
+    assert result.exit_code == 0
+    mock_copy_with_server.assert_called_once_with(
+        "source.txt",
+        "dest.txt",
+        "server.example.com",
+        port=31337,
+        compression_level=0,
+    )
+    assert "Copied" in result.output
+
+
+@mock.patch("eacopy.copy")
+def test_cli_error(mock_copy, runner, cli_fs):
     """Test CLI error handling."""
     mock_copy.side_effect = Exception("Test error")
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Create a test file
-        with open("source.txt", "w") as f:
-            f.write("test content")
-
-        result = runner.invoke(cli.cli, ["cp", "source.txt", "dest.txt"])
-        assert result.exit_code == 1
-        assert "Error" in result.output
+
+    result = runner.invoke(cli.cli, ["cp", "source.txt", "dest.txt"])
+    assert result.exit_code == 1
+    assert "Error" in result.output
@@ -0,0 +1,29 @@
+"""Test the global configuration and the package namespace."""
+
+# Import built-in modules
+import subprocess
+import sys
+
+# Import local modules
+import eacopy
+
+
+def test_config_instance():
+    """Test that the package exposes a Config instance."""
+    assert isinstance(eacopy.config, eacopy.Config)
+
+
+def test_config_after_submodule_import():
+    """Test that importing the config submodule first keeps the Config instance."""
+    code = (
+        "from eacopy.config import Config\n"
+        "import eacopy\n"
+        "assert isinstance(eacopy.config, Config), type(eacopy.config)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_dir_lists_public_names():
+    """Test that dir() shows the public names, including lazily imported ones."""
+    assert set(eacopy.__all__) <= set(dir(eacopy))
+    assert "importlib" not in dir(eacopy)
@@ -0,0 +1,220 @@
+"""Test single file copy functions."""
+
+# Import built-in modules
+import os
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+import eacopy
+
+# Runs a test once per single file copy function, with readable test ids
+copy_functions = pytest.mark.parametrize(
+    "copy_func",
+    [eacopy.copyfile, eacopy.copy, eacopy.copy2],
+    ids=["copyfile", "copy", "copy2"],
+)
+
+
+@copy_functions
+def test_copy_content(tmp_path, copy_func):
+    """Test that file content is copied."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"test content")
+    dst = tmp_path / "dest.txt"
+
+    copy_func(str(src), str(dst))
+
+    assert dst.read_bytes() == b"test content"
+
+
+@copy_functions
+def test_copy_overwrites_destination(tmp_path, copy_func):
+    """Test that an existing, longer destination file is truncated."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"short")
+    dst = tmp_path / "dest.txt"
+    dst.write_bytes(b"a much longer existing file")
+
+    copy_func(str(src), str(dst))
+
+    assert dst.read_bytes() == b"short"
+
+
+@copy_functions
+def test_copy_binary_content(binary_file, tmp_path, copy_func):
+    """Test that binary content is copied byte for byte."""
+    dst = tmp_path / "dest.bin"
+
+    copy_func(str(binary_file), str(dst))
+
+    assert dst.read_bytes() == binary_file.read_bytes()
+
+
+@pytest.mark.xfail(
+    os.name == "nt",
+    reason="The EACopyClient path used on Windows takes narrow strings, which cannot hold non-ANSI names",
+    strict=False,
+)
+def test_copy_unicode_filename(unicode_filename, tmp_path):
+    """Test copying a file with a non-ASCII name."""
+    dst = tmp_path / "目标_назначение.txt"
+
+    eacopy.copy(str(unicode_filename), str(dst))
+
+    assert dst.read_text(encoding="utf-8") == "unicode content"
+
+
+def test_copy_path_objects(tmp_path):
+    """Test that os.PathLike arguments are accepted."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"test content")
+    dst = tmp_path / "dest.txt"
+
+    eacopy.copy(src, dst)
+
+    assert dst.read_bytes() == b"test content"
+
+
+def test_copy_empty_file(tmp_path):
+    """Test copying an empty file."""
+    src = tmp_path / "empty.txt"
+    src.write_bytes(b"")
+    dst = tmp_path / "dest.txt"
+
+    eacopy.copy(str(src), str(dst))
+
+    assert dst.read_bytes() == b""
+
+
+def test_copy_into_directory(tmp_path):
+    """Test that copying into a directory keeps the source file name."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"test content")
+    dst_dir = tmp_path / "dest"
+    dst_dir.mkdir()
+
+    eacopy.copy(str(src), str(dst_dir))
+
+    assert (dst_dir / "source.txt").read_bytes() == b"test content"
+
+
+def test_copy2_preserves_metadata(tmp_path):
+    """Test that copy2 preserves timestamps and permission bits."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"test content")
+    os.chmod(src, 0o640)
+    os.utime(src, (1000000000, 1000000000))
+    dst = tmp_path / "dest.txt"
+
+    eacopy.copy2(str(src), str(dst))
+
+    src_stat = os.stat(src)
+    dst_stat = os.stat(dst)
+    assert abs(dst_stat.st_mtime_ns - src_stat.st_mtime_ns) < 1_000_000_000
+    if os.name != "nt":
+        assert dst_stat.st_mode & 0o777 == 0o640
+
+
+def test_copy_missing_source(tmp_path):
+    """Test that copying a missing file raises an error."""
+    with pytest.raises(RuntimeError):
+        eacopy.copy(str(tmp_path / "missing.txt"), str(tmp_path / "dest.txt"))
+
+
+@copy_functions
+def test_copy_same_file(tmp_path, copy_func):
+    """Test that copying a file onto itself fails without truncating it."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"test content")
+
+    with pytest.raises(RuntimeError, match="same file"):
+        copy_func(str(src), str(src))
+
+    assert src.read_bytes() == b"test content"
+
+
+# A sysfs file that reports a page sized st_size but holds a few bytes
+_SYSFS_FILE = "/sys/devices/system/cpu/online"
+
+
+@pytest.mark.skipif(not os.path.exists(_SYSFS_FILE), reason="Requires sysfs")
+def test_copy_sysfs_file(tmp_path):
+    """Test copying a file whose reported size does not match its content."""
+    dst = tmp_path / "online"
+
+    eacopy.copyfile(_SYSFS_FILE, str(dst))
+
+    with open(_SYSFS_FILE, "rb") as f:
+        assert dst.read_bytes() == f.read()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Requires named pipes")
+@pytest.mark.parametrize("copy_func", [eacopy.copy, eacopy.copy2], ids=["copy", "copy2"])
+def test_copy_named_pipe(tmp_path, copy_func):
+    """Test that copying a named pipe fails instead of waiting for a writer."""
+    src = tmp_path / "pipe"
+    os.mkfifo(src)
+
+    with pytest.raises(RuntimeError, match="named pipe"):
+        copy_func(str(src), str(tmp_path / "dest"))
+
+
+def test_eacopy_buffer_size(tmp_path):
+    """Test copying through an EACopy instance with a custom buffer size."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"x" * 10000)
+    dst = tmp_path / "dest.txt"
+
+    eacopy.EACopy(buffer_size=4096).copy(str(src), str(dst))
+
+    assert dst.read_bytes() == b"x" * 10000
+
+
+# A procfs file reports a size of 0, so it is always copied through the
+# pooled read()/write() buffers
+_PROCFS_FILE = "/proc/version"
+
+
+@pytest.mark.skipif(
+    not hasattr(eacopy._eacopy_binding, "_pooled_buffer_bytes") or not os.path.exists(_PROCFS_FILE),
+    reason="Requires the native copy and procfs",
+)
+@pytest.mark.parametrize("buffer_size", [16, 4 * 1024 * 1024], ids=["small", "larger_than_default"])
+def test_eacopy_read_write_fallback(tmp_path, buffer_size):
+    """Test the buffered copy and that only buffers up to the default size are pooled."""
+    dst = tmp_path / "version"
+    copier = eacopy.EACopy(buffer_size=buffer_size)
+    pooled_before = eacopy._eacopy_binding._pooled_buffer_bytes()
+
+    copier.copyfile(_PROCFS_FILE, str(dst))
+
+    with open(_PROCFS_FILE, "rb") as f:
+        assert dst.read_bytes() == f.read()
+    pooled_after = eacopy._eacopy_binding._pooled_buffer_bytes()
+    if buffer_size > 1024 * 1024:
+        assert pooled_after == pooled_before
+    else:
+        assert pooled_after >= buffer_size
+
+
+def test_eacopy_invalid_buffer_size():
+    """Test that a zero buffer size is rejected."""
+    with pytest.raises(ValueError):
+        eacopy.EACopy(buffer_size=0)
+
+
+def test_copy2_many_reports_failures(tmp_path):
+    """Test that a batch copy continues past failures and reports them by index."""
+    src = tmp_path / "source.txt"
+    src.write_bytes(b"test content")
+    pairs = [
+        (str(tmp_path / "missing.txt"), str(tmp_path / "missing_copy.txt")),
+        (str(src), str(tmp_path / "dest.txt")),
+    ]
+
+    failures = eacopy._eacopy_binding.copy2_many(pairs)
+
+    assert [index for index, _ in failures] == [0]
+    assert (tmp_path / "dest.txt").read_bytes() == b"test content"
@@ -0,0 +1,211 @@
+"""Test directory tree copying."""
+
+# Import built-in modules
+import os
+import signal
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+import eacopy
+
+
+def test_copytree(nested_dir_structure, dest_dir):
+    """Test copying a nested directory tree."""
+    eacopy.copytree(str(nested_dir_structure), str(dest_dir))
+
+    assert (dest_dir / "root.txt").read_text() == "root file"
+    assert (dest_dir / "subdir" / "sub.txt").read_text() == "sub file"
+    assert (dest_dir / "subdir" / "deep" / "deep.txt").read_text() == "deep file"
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4], ids=["serial", "parallel"])
+def test_copytree_max_concurrency(nested_dir_structure, dest_dir, max_concurrency):
+    """Test copying with a bounded number of concurrent copies."""
+    eacopy.copytree(str(nested_dir_structure), str(dest_dir), max_concurrency=max_concurrency)
+
+    assert (dest_dir / "subdir" / "deep" / "deep.txt").read_text() == "deep file"
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_copytree_invalid_max_concurrency(nested_dir_structure, dest_dir, max_concurrency):
+    """Test that a max_concurrency below 1 is rejected."""
+    with pytest.raises(ValueError):
+        eacopy.copytree(str(nested_dir_structure), str(dest_dir), max_concurrency=max_concurrency)
+
+    assert not dest_dir.exists()
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 8], ids=["serial", "parallel"])
+def test_copytree_mixed_file_sizes(large_file, dest_dir, max_concurrency):
+    """Test copying a tree with both small and large files."""
+    eacopy.copytree(str(large_file.parent), str(dest_dir), max_concurrency=max_concurrency)
+
+    assert (dest_dir / "large.txt").read_bytes() == large_file.read_bytes()
+    assert (dest_dir / "small.txt").read_text() == "small file"
+
+
+def test_copytree_reuses_worker_pools(nested_dir_structure, tmp_path):
+    """Test that repeated copies with the same concurrency share their workers."""
+    eacopy.copytree(str(nested_dir_structure), str(tmp_path / "first"), max_concurrency=8)
+    executors = dict(eacopy.tree._executors)
+
+    eacopy.copytree(str(nested_dir_structure), str(tmp_path / "second"), max_concurrency=8)
+
+    assert eacopy.tree._executors == executors
+    assert (tmp_path / "second" / "subdir" / "deep" / "deep.txt").exists()
+
+
+def test_copytree_replaces_resized_worker_pools(nested_dir_structure, tmp_path):
+    """Test that a different concurrency replaces the worker pools and shuts down the old ones."""
+    eacopy.copytree(str(nested_dir_structure), str(tmp_path / "first"), max_concurrency=8)
+    old_pools = dict(eacopy.tree._executors)
+
+    eacopy.copytree(str(nested_dir_structure), str(tmp_path / "second"), max_concurrency=2)
+
+    assert set(eacopy.tree._executors) == {"small", "large"}
+    assert eacopy.tree._executors["small"].max_workers == 2
+    with pytest.raises(RuntimeError):
+        old_pools["small"].executor.submit(print)
+    assert (tmp_path / "second" / "subdir" / "deep" / "deep.txt").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork()")
+# Python 3.12+ warns about forking a process that has threads, which is the
+# situation under test
+@pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+def test_copytree_in_forked_child(nested_dir_structure, tmp_path):
+    """Test that a forked child does not wait on the parent's worker pools."""
+    eacopy.copytree(str(nested_dir_structure), str(tmp_path / "parent"))
+
+    pid = os.fork()
+    if pid == 0:
+        # Die instead of hanging the test run if the copy never finishes
+        signal.alarm(10)
+        try:
+            eacopy.copytree(str(nested_dir_structure), str(tmp_path / "child"))
+        except BaseException:
+            os._exit(1)
+        os._exit(0)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    assert (tmp_path / "child" / "subdir" / "deep" / "deep.txt").exists()
+
+
+@pytest.mark.xfail(
+    os.name == "nt",
+    reason="The EACopyClient path used on Windows takes narrow strings, which cannot hold non-ANSI names",
+    strict=False,
+)
+def test_copytree_unicode_filename(unicode_filename, dest_dir):
+    """Test copying a tree containing a non-ASCII file name."""
+    eacopy.copytree(unicode_filename.parent, dest_dir)
+
+    assert (dest_dir / unicode_filename.name).read_text(encoding="utf-8") == "unicode content"
+
+
+def test_copytree_empty_directory(source_dir, dest_dir):
+    """Test that empty directories are copied."""
+    (source_dir / "empty").mkdir()
+
+    eacopy.copytree(str(source_dir), str(dest_dir))
+
+    assert (dest_dir / "empty").is_dir()
+
+
+def test_copytree_into_itself(source_dir):
+    """Test that a destination inside the source is rejected before anything is copied."""
+    (source_dir / "root.txt").write_bytes(b"root file")
+
+    with pytest.raises(RuntimeError, match="into itself"):
+        eacopy.copytree(str(source_dir), str(source_dir / "copy"))
+
+    assert not (source_dir / "copy").exists()
+
+
+def test_binding_copytree_into_itself(source_dir):
+    """Test that the binding's own copytree also rejects a destination inside the source."""
+    with pytest.raises(RuntimeError, match="into itself"):
+        eacopy._eacopy_binding.copytree(str(source_dir), str(source_dir / "sub" / "copy"))
+
+    assert not (source_dir / "sub").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Requires named pipes")
+def test_copytree_named_pipe(source_dir, dest_dir):
+    """Test that a named pipe in the tree is reported instead of hanging a worker."""
+    os.mkfifo(source_dir / "pipe")
+
+    with pytest.raises(RuntimeError, match="Not a regular file"):
+        eacopy.copytree(str(source_dir), str(dest_dir))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows does not have POSIX permission bits")
+def test_copytree_directory_metadata(source_dir, dest_dir):
+    """Test that directories keep their permission bits and timestamps."""
+    private = source_dir / "private"
+    private.mkdir()
+    (private / "secret.txt").write_bytes(b"secret")
+    os.chmod(private, 0o700)
+    os.chmod(source_dir, 0o750)
+    os.utime(private, (1000000000, 1000000000))
+
+    eacopy.copytree(str(source_dir), str(dest_dir))
+
+    assert os.stat(dest_dir / "private").st_mode & 0o777 == 0o700
+    assert os.stat(dest_dir).st_mode & 0o777 == 0o750
+    assert os.stat(dest_dir / "private").st_mtime_ns == os.stat(private).st_mtime_ns
+    assert (dest_dir / "private" / "secret.txt").read_bytes() == b"secret"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows does not have POSIX permission bits")
+def test_binding_copytree_directory_metadata(source_dir, dest_dir):
+    """Test that the binding's own copytree keeps directory permission bits and timestamps."""
+    private = source_dir / "private"
+    private.mkdir()
+    (private / "secret.txt").write_bytes(b"secret")
+    os.chmod(private, 0o700)
+    os.utime(private, (1000000000, 1000000000))
+
+    eacopy._eacopy_binding.copytree(str(source_dir), str(dest_dir))
+
+    assert os.stat(dest_dir / "private").st_mode & 0o777 == 0o700
+    assert os.stat(dest_dir / "private").st_mtime_ns == os.stat(private).st_mtime_ns
+    assert (dest_dir / "private" / "secret.txt").read_bytes() == b"secret"
+
+
+def test_copytree_destination_exists(nested_dir_structure, dest_dir):
+    """Test that an existing destination is rejected unless dirs_exist_ok is set."""
+    dest_dir.mkdir()
+
+    with pytest.raises(RuntimeError):
+        eacopy.copytree(str(nested_dir_structure), str(dest_dir))
+
+    eacopy.copytree(str(nested_dir_structure), str(dest_dir), dirs_exist_ok=True)
+    assert (dest_dir / "subdir" / "sub.txt").read_text() == "sub file"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Creating symlinks requires privileges on Windows")
+def test_copytree_symlinks(source_dir, dest_dir):
+    """Test that symlinks are preserved when requested."""
+    (source_dir / "root.txt").write_bytes(b"root file")
+    os.symlink("root.txt", source_dir / "link.txt")
+
+    eacopy.copytree(str(source_dir), str(dest_dir), symlinks=True)
+
+    assert os.readlink(dest_dir / "link.txt") == "root.txt"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Creating symlinks requires privileges on Windows")
+def test_copytree_ignore_dangling_symlinks(source_dir, dest_dir):
+    """Test that dangling symlinks can be skipped."""
+    (source_dir / "root.txt").write_bytes(b"root file")
+    os.symlink("missing.txt", source_dir / "dangling.txt")
+
+    with pytest.raises(RuntimeError):
+        eacopy.copytree(str(source_dir), str(dest_dir))
+
+    eacopy.copytree(str(source_dir), str(dest_dir), ignore_dangling_symlinks=True, dirs_exist_ok=True)
+    assert not os.path.lexists(dest_dir / "dangling.txt")
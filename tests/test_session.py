@@ -0,0 +1,25 @@
+"""Test copying through an EACopyService session."""
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+import eacopy
+
+
+def test_session_invalid_streams():
+    """Test that a session needs at least one stream."""
+    with pytest.raises(ValueError):
+        eacopy.Session("localhost", streams=0)
+
+
+def test_session_copy_many_reports_all_failures(tmp_path):
+    """Test that every failed transfer is reported in a single error."""
+    missing = [tmp_path / "missing1.txt", tmp_path / "missing2.txt"]
+
+    with eacopy.Session("localhost") as session:
+        with pytest.raises(RuntimeError) as excinfo:
+            session.copy_many([(path, tmp_path / "dest" / path.name) for path in missing])
+
+    for path in missing:
+        assert str(path) in str(excinfo.value)
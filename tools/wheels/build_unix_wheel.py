@@ -35,21 +35,23 @@ def run_command(cmd, cwd=None, env=None):
         return False, str(e)
 
 
+def list_wheels(directory):
+    """Return the names of the wheel files in a directory, sorted."""
+    with os.scandir(directory) as it:
+        return sorted(entry.name for entry in it if entry.name.endswith(".whl") and entry.is_file())
+
+
 def install_dependencies():
     """Install build dependencies."""
     print("Installing build dependencies...")
     
-    # Install basic dependencies
-    success, _ = run_command(
-        [sys.executable, "-m", "pip", "install", "--upgrade", "pip", "wheel", "setuptools"]
-    )
-    if not success:
-        return False
-    
-    # Install build dependencies
+    # Install basic and build dependencies with a single resolver run
     success, _ = run_command(
         [
-            sys.executable, "-m", "pip", "install",
+            sys.executable, "-m", "pip", "install", "--upgrade",
+            "pip",
+            "wheel",
+            "setuptools",
             "scikit-build-core>=0.5.0",
             "pybind11>=2.10.0",
             "cmake>=3.15.0",
@@ -152,12 +154,11 @@ def build_wheels():
             # If using build, move wheels from dist to wheelhouse
             if method["name"] == "build" and os.path.exists("dist"):
                 os.makedirs("wheelhouse", exist_ok=True)
-                for wheel in os.listdir("dist"):
-                    if wheel.endswith(".whl"):
-                        src = os.path.join("dist", wheel)
-                        dst = os.path.join("wheelhouse", wheel)
-                        print(f"Moving {src} to {dst}")
-                        os.rename(src, dst)
+                for wheel in list_wheels("dist"):
+                    src = os.path.join("dist", wheel)
+                    dst = os.path.join("wheelhouse", wheel)
+                    print(f"Moving {src} to {dst}")
+                    os.rename(src, dst)
             
             return True
         
@@ -176,7 +177,7 @@ def verify_wheels():
         return False
     
     # List wheels
-    wheels = [f for f in os.listdir("wheelhouse") if f.endswith(".whl")]
+    wheels = list_wheels("wheelhouse")
     if not wheels:
         print("No wheels found in wheelhouse directory.")
         return False